@@ -2,14 +2,6 @@
 Instagram Follower Audit Tool package.
 """
 
-from pathlib import Path
-import sys
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 # Version
 __version__ = "0.1.0"
 
@@ -21,9 +13,6 @@ from .constants import (
     RiskLevel,
     EngagementType,
     RISK_THRESHOLDS,
+    classify_risk,
     ENGAGEMENT_CATEGORIES
-)
-
-# Add the app directory to Python path
-app_dir = Path(__file__).parent
-sys.path.append(str(app_dir)) 
\ No newline at end of file
+)
\ No newline at end of file
@@ -29,6 +29,9 @@ class AppConfig:
     REFRESH_INTERVAL: int = 60  # seconds
     MAX_DISPLAY_ITEMS: int = 100
     
+    # Cache Settings
+    CACHE_TTL: int = 3600  # seconds
+    
     # Logging Settings
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -37,13 +40,17 @@ class AppConfig:
     LOG_DIR: str = "logs"
     CACHE_DIR: str = "cache"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
-        return {
+    def __post_init__(self):
+        """Build the public settings dictionary once; settings are not changed at runtime."""
+        self._settings = {
             key: value
             for key, value in self.__dict__.items()
             if not key.startswith('_')
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary."""
+        return self._settings.copy()
 
 # Create global configuration instance
 APP_CONFIG = AppConfig()
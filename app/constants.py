@@ -3,8 +3,9 @@ Constants and enums for the Instagram Follower Audit Tool.
 This module contains predefined values used throughout the application.
 """
 
+from bisect import bisect_left
 from enum import Enum
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, Tuple
 
 class RiskLevel(Enum):
     """Risk level classification."""
@@ -36,14 +37,33 @@ RISK_THRESHOLDS = {
     RiskLevel.CRITICAL: 0.9
 }
 
+# Thresholds as parallel sorted tuples for bisect-based classification
+_SORTED_RISK_THRESHOLDS = sorted(RISK_THRESHOLDS.items(), key=lambda kv: kv[1])
+_RISK_BREAKPOINTS: Tuple[float, ...] = tuple(value for _, value in _SORTED_RISK_THRESHOLDS)
+_RISK_LEVELS: Tuple[RiskLevel, ...] = tuple(level for level, _ in _SORTED_RISK_THRESHOLDS)
+
+def classify_risk(score: float) -> RiskLevel:
+    """Map a risk score to the lowest level whose threshold it does not exceed.
+    
+    Scores above the highest threshold are classified as critical.
+    
+    Args:
+        score: Risk score (0-1)
+        
+    Returns:
+        Matching risk level
+    """
+    index = bisect_left(_RISK_BREAKPOINTS, score)
+    return _RISK_LEVELS[min(index, len(_RISK_LEVELS) - 1)]
+
 # Common pronouns for profile analysis
-PRONOUNS: Set[str] = {
+PRONOUNS: FrozenSet[str] = frozenset({
     "he/him", "she/her", "they/them", "he/they", "she/they",
     "they/he", "they/she", "it/its", "any/all", "other"
-}
+})
 
 # Demographic keywords for bio analysis
-DEMOGRAPHIC_KEYWORDS: Set[str] = {
+DEMOGRAPHIC_KEYWORDS: FrozenSet[str] = frozenset({
     # Music-related
     "listener", "fan", "music", "concert", "gig", "tour", "album",
     "song", "artist", "musician", "band", "singer", "producer",
@@ -59,15 +79,18 @@ DEMOGRAPHIC_KEYWORDS: Set[str] = {
     # Lifestyle
     "travel", "food", "fitness", "health", "wellness",
     "fashion", "style", "beauty", "lifestyle"
-}
+})
 
 # Core Instagram accounts to monitor
-CORE_ACCOUNTS: List[str] = [
+CORE_ACCOUNTS: Tuple[str, ...] = (
     "instagram",
     "meta",
     "facebook",
     "threads"
-]
+)
+
+# Fields every uploaded follower record must provide
+REQUIRED_FOLLOWER_FIELDS: FrozenSet[str] = frozenset({"username"})
 
 # Evaluation thresholds
 EVALUATION_THRESHOLDS = {
@@ -115,6 +138,8 @@ SUCCESS_MESSAGES = {
 # File extensions
 FILE_EXTENSIONS = {
     "export": {
+        "parquet": ".parquet",
+        "feather": ".feather",
         "csv": ".csv",
         "json": ".json",
         "excel": ".xlsx"
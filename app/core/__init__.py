@@ -1,11 +1,23 @@
 """
 Core functionality for the Instagram Follower Audit Tool.
+
+Submodules are imported on first attribute access, so importing a single
+component does not pull in the dependencies of the others.
 """
 
-from .workflow import WorkflowController, AuditResult
-from .analyzer import ProfileAnalyzer, ProfileMetrics
-from .engagement import EngagementChecker, EngagementResult
-from .logger import AuditLogger
+from importlib import import_module
+from typing import Any
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'WorkflowController': '.workflow',
+    'AuditResult': '.workflow',
+    'ProfileAnalyzer': '.analyzer',
+    'ProfileMetrics': '.analyzer',
+    'EngagementChecker': '.engagement',
+    'EngagementResult': '.engagement',
+    'AuditLogger': '.logger'
+}
 
 __all__ = [
     'WorkflowController',
@@ -15,4 +27,19 @@ __all__ = [
     'EngagementChecker',
     'EngagementResult',
     'AuditLogger'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` and cache the attribute."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazily loaded names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -5,17 +5,18 @@ This module provides intelligent analysis of follower profiles to detect potenti
 
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
-import numpy as np
 import logging
-import json
 from pathlib import Path
-import openai
-from app.utils.helpers import async_retry, safe_json_loads, validate_required_fields
+from app.utils.helpers import async_retry, load_mock_data, safe_json_loads, validate_required_fields
 from app.core.logger import AuditLogger
 import os
 import asyncio
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+_MOCK_DATA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "mock_engagement.json"
+
+@dataclass(slots=True)
 class ProfileMetrics:
     """Container for profile analysis metrics."""
     authenticity_score: float
@@ -40,26 +41,28 @@ class ProfileAnalyzer:
             'interaction': 0.2,
             'age': 0.2
         }
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.audit_logger = AuditLogger()
         
-        # Initialize OpenAI client
-        if api_key:
-            openai.api_key = api_key
-        else:
-            # Try to load from environment
+        # Try to load the key from the environment
+        if not api_key:
             try:
                 from dotenv import load_dotenv
                 load_dotenv()
-                openai.api_key = os.getenv("OPENAI_API_KEY")
+                api_key = os.getenv("OPENAI_API_KEY")
             except ImportError:
                 self.logger.warning("python-dotenv not installed")
         
+        # Initialize OpenAI client; openai is only imported when a key is set.
+        # The client owns a connection pool reused by every call on this analyzer.
+        self._client = None
+        if api_key:
+            import openai
+            self._client = openai.AsyncOpenAI(api_key=api_key)
+        
         # Load mock data for testing
         try:
-            mock_data_path = Path(__file__).parent.parent.parent / "data" / "mock_engagement.json"
-            with open(mock_data_path) as f:
-                self.mock_data = json.load(f)
+            self.mock_data = load_mock_data(_MOCK_DATA_PATH)
         except Exception as e:
             self.logger.warning(f"Could not load mock data: {str(e)}")
             self.mock_data = {}
@@ -175,11 +178,11 @@ class ProfileAnalyzer:
     
     def _calculate_risk_score(self, metrics: ProfileMetrics) -> float:
         """Calculate overall risk score from metrics."""
-        scores = [
-            metrics.authenticity_score * self.weights['activity'],
-            metrics.engagement_potential * self.weights['content'],
-            metrics.risk_level * self.weights['interaction'],
-            metrics.interaction_pattern * self.weights['interaction'],
-            metrics.account_age * self.weights['age']
-        ]
-        return np.mean(scores) 
\ No newline at end of file
+        weights = self.weights
+        return (
+            metrics.authenticity_score * weights['activity']
+            + metrics.engagement_potential * weights['content']
+            + metrics.risk_level * weights['interaction']
+            + metrics.interaction_pattern * weights['interaction']
+            + metrics.account_age * weights['age']
+        ) / 5.0 
\ No newline at end of file
@@ -4,11 +4,10 @@ Engagement analysis module for the Instagram Follower Audit Tool.
 
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
-import json
 import asyncio
 from pathlib import Path
 from app.core.logger import AuditLogger
-from app.utils.helpers import async_retry, safe_json_loads, validate_required_fields
+from app.utils.helpers import async_retry, load_mock_data, safe_json_loads, validate_required_fields
 import logging
 import os
 import random
@@ -16,7 +15,7 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class EngagementResult:
     """Result of engagement analysis."""
     score: float
@@ -27,6 +26,9 @@ class EngagementResult:
 class EngagementChecker:
     """Analyzes follower engagement metrics."""
     
+    # Metrics generated for followers without mock data
+    _DEFAULT_KEYS = ("likes", "comments", "shares", "saves")
+    
     def __init__(self):
         """Initialize the engagement checker."""
         self.mock_data_path = Path("data/mock_engagement.json")
@@ -34,11 +36,7 @@ class EngagementChecker:
     
     def _load_mock_data(self):
         """Load mock engagement data."""
-        if self.mock_data_path.exists():
-            with open(self.mock_data_path) as f:
-                self.mock_data = json.load(f)
-        else:
-            self.mock_data = {}
+        self.mock_data = load_mock_data(self.mock_data_path)
     
     @async_retry(
         max_attempts=3,
@@ -58,15 +56,16 @@ class EngagementChecker:
         username = follower_data.get("username", "Unknown")
         
         # Get mock data for this follower
-        mock_metrics = self.mock_data.get(username, {
-            "likes": random.uniform(0, 1),
-            "comments": random.uniform(0, 1),
-            "shares": random.uniform(0, 1),
-            "saves": random.uniform(0, 1)
-        })
-        
-        # Calculate engagement score
-        engagement_score = sum(mock_metrics.values()) / len(mock_metrics)
+        mock_metrics = self.mock_data.get(username)
+        if mock_metrics is None:
+            likes, comments, shares, saves = (
+                random.random(), random.random(), random.random(), random.random()
+            )
+            mock_metrics = dict(zip(self._DEFAULT_KEYS, (likes, comments, shares, saves)))
+            engagement_score = (likes + comments + shares + saves) * 0.25
+        else:
+            # Calculate engagement score
+            engagement_score = sum(mock_metrics.values()) / len(mock_metrics)
         
         # Generate last interaction date
         last_interaction = datetime.now() - timedelta(
@@ -3,27 +3,39 @@ Logging functionality for the Instagram Follower Audit Tool.
 """
 
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 import json
+import orjson
 
 class AuditLogger:
     """Handles logging of audit operations."""
     
+    # Handlers are attached to the shared module logger, so only do it once
+    _configured = False
+    
     def __init__(self):
         """Initialize the audit logger."""
         self.logger = logging.getLogger(__name__)
+        self.logs_dir = Path("logs")
+        
+        if AuditLogger._configured:
+            return
+        
         self.logger.setLevel(logging.INFO)
         
         # Create logs directory if it doesn't exist
-        self.logs_dir = Path("logs")
         self.logs_dir.mkdir(exist_ok=True)
         
-        # Set up file handler
-        log_file = self.logs_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file)
+        # Set up file handler; the handler outlives the day it was created on,
+        # so roll over at midnight into audit_YYYYMMDD.log
+        log_file = self.logs_dir / "audit.log"
+        file_handler = logging.handlers.TimedRotatingFileHandler(log_file, when="midnight")
+        file_handler.suffix = "%Y%m%d"
+        file_handler.namer = self._rotated_log_name
         file_handler.setLevel(logging.INFO)
         
         # Set up console handler
@@ -34,12 +46,25 @@ class AuditLogger:
         formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
         )
+        formatter.default_msec_format = None
+        
+        # The format uses no thread/process fields, so skip collecting them per record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
         # Add handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
+        AuditLogger._configured = True
+    
+    @staticmethod
+    def _rotated_log_name(default_name: str) -> str:
+        """Map the handler's audit.log.YYYYMMDD name to audit_YYYYMMDD.log."""
+        base, _, date = default_name.rpartition(".")
+        return f"{base[:-len('.log')]}_{date}.log"
     
     def log_audit(
         self,
@@ -58,8 +83,8 @@ class AuditLogger:
             action: Action taken (keep/remove/monitor)
             reason: Optional reason for the action
         """
+        # The record's asctime already stamps each line
         log_data = {
-            "timestamp": datetime.now().isoformat(),
             "username": username,
             "engagement_score": engagement_score,
             "risk_score": risk_score,
@@ -67,7 +92,7 @@ class AuditLogger:
             "reason": reason
         }
         
-        self.logger.info(f"Audit result for {username}: {json.dumps(log_data)}")
+        self.logger.info(f"Audit result for {username}: {orjson.dumps(log_data).decode()}")
     
     def log_error(self, username: str, error: str):
         """Log an error.
@@ -90,7 +115,8 @@ class AuditLogger:
         if not logs_dir.exists():
             return None
             
-        log_files = list(logs_dir.glob("audit_*.log"))
+        # Current day's audit.log plus the rotated audit_YYYYMMDD.log files
+        log_files = list(logs_dir.glob("audit*.log"))
         if not log_files:
             return None
             
@@ -98,7 +124,7 @@ class AuditLogger:
 
     def _save_detailed_result(self, result: Dict[str, Any]) -> None:
         """Save detailed audit result to a JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         result_file = self.logs_dir / f'audit_result_{timestamp}.json'
         
         with open(result_file, 'w') as f:
@@ -2,14 +2,13 @@
 
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
-import json
 import os
 from pathlib import Path
 import random
 
-from app.utils.helpers import async_retry
+from app.utils.helpers import async_retry, load_mock_data
 
-@dataclass
+@dataclass(slots=True)
 class ProfileResult:
     """Result of profile analysis."""
     risk_score: float
@@ -31,11 +30,7 @@ class ProfileAnalyzer:
     
     def _load_mock_data(self):
         """Load mock profile data."""
-        if self.mock_data_path.exists():
-            with open(self.mock_data_path) as f:
-                self.mock_data = json.load(f)
-        else:
-            self.mock_data = {}
+        self.mock_data = load_mock_data(self.mock_data_path)
     
     @async_retry(
         max_attempts=3,
@@ -55,11 +50,13 @@ class ProfileAnalyzer:
         username = follower_data.get("username", "Unknown")
         
         # Get mock data for this follower
-        mock_profile = self.mock_data.get(username, {
-            "risk_score": random.uniform(0, 1),
-            "analysis": "Standard profile with normal activity",
-            "confidence": random.uniform(0.8, 1.0)
-        })
+        mock_profile = self.mock_data.get(username)
+        if mock_profile is None:
+            return ProfileResult(
+                risk_score=random.random(),
+                analysis="Standard profile with normal activity",
+                confidence=0.8 + 0.2 * random.random()
+            )
         
         return ProfileResult(
             risk_score=mock_profile["risk_score"],
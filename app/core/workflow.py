@@ -3,7 +3,9 @@ Workflow controller for the Instagram Follower Audit Tool.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import functools
+import hashlib
 import logging
 import asyncio
 from datetime import datetime
@@ -14,6 +16,7 @@ from pathlib import Path
 from app.core.engagement import EngagementChecker, EngagementResult
 from app.core.profile import ProfileAnalyzer, ProfileResult
 from app.core.logger import AuditLogger
+from app.config import APP_CONFIG
 from app.constants import (
     EvaluationAction,
     PRONOUNS,
@@ -21,7 +24,35 @@ from app.constants import (
     EVALUATION_THRESHOLDS
 )
 
-@dataclass
+# Bound once so _determine_action avoids enum attribute lookups per follower
+_KEEP = EvaluationAction.KEEP
+_MONITOR = EvaluationAction.MONITOR
+_REMOVE = EvaluationAction.REMOVE
+
+@functools.lru_cache(maxsize=256)
+def _analysis_recommendations(analysis: str) -> Tuple[str, ...]:
+    """Recommendations derived from the profile analysis text.
+    
+    Analysis texts repeat heavily across followers, so results are cached per text.
+    
+    Args:
+        analysis: Profile analysis text
+        
+    Returns:
+        Tuple of recommendations
+    """
+    recommendations = []
+    lowered = analysis.lower()
+    
+    if "private" in lowered:
+        recommendations.append("Private account - Consider impact on engagement")
+        
+    if "inactive" in lowered:
+        recommendations.append("Inactive account - May be safe to remove")
+        
+    return tuple(recommendations)
+
+@dataclass(slots=True)
 class AuditResult:
     """Data class for storing audit results."""
     username: str
@@ -43,6 +74,13 @@ class WorkflowController:
         self.engagement_checker = EngagementChecker()
         self.profile_analyzer = ProfileAnalyzer(api_key)
         self.logger = AuditLogger()
+        
+        # Identifies the analysis configuration, so cached results from a
+        # differently configured controller are not reused
+        if api_key:
+            self.config_fingerprint = "key-" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        else:
+            self.config_fingerprint = "no-key"
     
     async def audit_follower(self, follower_data: Dict[str, Any]) -> Dict[str, Any]:
         """Audit a single follower's data.
@@ -89,13 +127,43 @@ class WorkflowController:
                 "risk_score": risk_score,
                 "action": action.value,
                 "reason": profile_result.analysis,
-                "recommendations": recommendations
+                "recommendations": recommendations,
+                "profile_pic_url": follower_data.get("profile_pic_url")
             }
             
         except Exception as e:
             self.logger.log_error(username, str(e))
             raise
     
+    async def audit_followers(
+        self,
+        followers: List[Dict[str, Any]],
+        concurrency: int = APP_CONFIG.BATCH_SIZE,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """Audit several followers concurrently.
+        
+        Args:
+            followers: List of follower data dictionaries
+            concurrency: Maximum number of audits in flight at once
+            return_exceptions: Return exceptions in place of failed results
+                instead of raising the first one
+            
+        Returns:
+            List of audit results in the same order as ``followers``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _audit_one(follower_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.audit_follower(follower_data)
+        
+        # gather already returns a list sized to the input, in input order
+        return await asyncio.gather(
+            *(_audit_one(follower) for follower in followers),
+            return_exceptions=return_exceptions
+        )
+    
     def _determine_action(self, engagement_score: float, risk_score: float) -> EvaluationAction:
         """Determine the action to take based on scores.
         
@@ -107,13 +175,13 @@ class WorkflowController:
             Action to take
         """
         if engagement_score >= 0.7 and risk_score <= 0.3:
-            return EvaluationAction.KEEP
+            return _KEEP
         elif engagement_score >= 0.5 and risk_score <= 0.5:
-            return EvaluationAction.MONITOR
+            return _MONITOR
         elif engagement_score <= 0.3 or risk_score >= 0.7:
-            return EvaluationAction.REMOVE
+            return _REMOVE
         else:
-            return EvaluationAction.MONITOR
+            return _MONITOR
     
     def _generate_recommendations(
         self,
@@ -139,10 +207,6 @@ class WorkflowController:
         if risk_score > 0.5:
             recommendations.append("High risk - Monitor closely or remove")
             
-        if "private" in analysis.lower():
-            recommendations.append("Private account - Consider impact on engagement")
-            
-        if "inactive" in analysis.lower():
-            recommendations.append("Inactive account - May be safe to remove")
+        recommendations.extend(_analysis_recommendations(analysis))
             
         return recommendations 
\ No newline at end of file
@@ -3,14 +3,23 @@ Reusable UI components for the Instagram Follower Audit Tool.
 This module provides custom Streamlit components for consistent UI elements.
 """
 
+import functools
 import streamlit as st
-from typing import List, Dict, Any, Optional
-import plotly.graph_objects as go
-from PIL import Image
-import io
-import base64
+from typing import List, Dict, Any, Optional, Tuple
 from app.constants import EvaluationAction
 
+# HTML templates, formatted with keyword arguments
+_BADGE_TEMPLATE = (
+    '<div style="background-color: {color}; color: white; padding: 5px 10px; '
+    'border-radius: 15px; display: inline-block; font-size: 0.8em;">{label}</div>'
+).format
+_PROFILE_TEMPLATE = (
+    '<div style="display: flex; align-items: center; gap: 10px;">'
+    '<img src="{url}" style="width: {size}px; height: {size}px; border-radius: 50%;">'
+    '<span>{username}</span></div>'
+).format
+_PROFILE_NO_PICTURE_TEMPLATE = '<div style="padding-left: {padding}px;">{username}</div>'.format
+
 def metric_card(
     title: str,
     value: float,
@@ -32,6 +41,7 @@ def metric_card(
         delta=f"{delta:+.1%}" if delta is not None else None
     )
 
+@functools.lru_cache(maxsize=8)
 def status_badge(action: str) -> str:
     """
     Create a colored status badge for keep/remove actions.
@@ -43,19 +53,9 @@ def status_badge(action: str) -> str:
         HTML string for the badge
     """
     color = "green" if action == EvaluationAction.KEEP.value else "red"
-    return f"""
-        <div style="
-            background-color: {color};
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            display: inline-block;
-            font-size: 0.8em;
-        ">
-            {action.upper()}
-        </div>
-    """
+    return _BADGE_TEMPLATE(color=color, label=action.upper())
 
+@functools.lru_cache(maxsize=8192)
 def profile_preview(
     username: str,
     profile_pic_url: Optional[str] = None,
@@ -73,14 +73,8 @@ def profile_preview(
         HTML string for the profile preview
     """
     if profile_pic_url:
-        return f"""
-            <div style="display: flex; align-items: center; gap: 10px;">
-                <img src="{profile_pic_url}" 
-                     style="width: {size}px; height: {size}px; border-radius: 50%;">
-                <span>{username}</span>
-            </div>
-        """
-    return f'<div style="padding-left: {size + 10}px;">{username}</div>'
+        return _PROFILE_TEMPLATE(url=profile_pic_url, size=size, username=username)
+    return _PROFILE_NO_PICTURE_TEMPLATE(padding=size + 10, username=username)
 
 def info_box(
     title: str,
@@ -159,22 +153,21 @@ def stats_summary(
     with col4:
         metric_card("Processing Time", processing_time, format="%.1fs")
 
-def engagement_chart(
-    metrics: Dict[str, float],
-    title: str = "Engagement Metrics"
-) -> None:
-    """
-    Display an engagement metrics radar chart.
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_engagement_figure(items: Tuple[Tuple[str, float], ...], title: str):
+    """Build the engagement radar figure; cached on the metric items and title.
     
-    Args:
-        metrics: Dictionary of metric names and values
-        title: Chart title
+    st.cache_data hands each caller its own copy, so sessions never share
+    one mutable figure.
     """
+    # Plotly is slow to import and only needed once a chart is drawn
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
-        r=list(metrics.values()),
-        theta=list(metrics.keys()),
+        r=[value for _, value in items],
+        theta=[name for name, _ in items],
         fill='toself',
         name='Engagement'
     ))
@@ -190,7 +183,23 @@ def engagement_chart(
         title=title
     )
     
-    st.plotly_chart(fig)
+    return fig
+
+def engagement_chart(
+    metrics: Dict[str, float],
+    title: str = "Engagement Metrics",
+    interactive: bool = True
+) -> None:
+    """
+    Display an engagement metrics radar chart.
+    
+    Args:
+        metrics: Dictionary of metric names and values
+        title: Chart title
+        interactive: Whether to enable zoom/hover; static charts render faster
+    """
+    fig = _build_engagement_figure(tuple(metrics.items()), title)
+    st.plotly_chart(fig, config={"staticPlot": not interactive})
 
 def recommendation_list(recommendations: List[str]) -> None:
     """
@@ -8,18 +8,28 @@ import pandas as pd
 from typing import Dict, List, Optional, Any
 import time
 from datetime import datetime
-import json
+import io
 import os
 from pathlib import Path
 import traceback
 import asyncio
+import hashlib
+from collections import Counter
+import orjson
 
+# uvloop is faster than the default event loop but unavailable on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from app.config import APP_CONFIG
+from app.constants import CACHE_KEYS, REQUIRED_FOLLOWER_FIELDS
 from app.core.workflow import WorkflowController
 from app.core.logger import AuditLogger
+from app.utils.helpers import safe_json_loads
 from app.ui.components import (
     metric_card,
-    status_badge,
-    profile_preview,
     info_box,
     loading_spinner,
     error_message,
@@ -32,8 +42,14 @@ from app.ui.components import (
 
 def initialize_session_state():
     """Initialize all session state variables."""
-    if "audit_results" not in st.session_state:
-        st.session_state.audit_results = None
+    if "audit_results_df" not in st.session_state:
+        st.session_state.audit_results_df = None
+    if "audit_exports" not in st.session_state:
+        st.session_state.audit_exports = {}
+    if "audit_cache" not in st.session_state:
+        st.session_state.audit_cache = {}
+    if "action_counts" not in st.session_state:
+        st.session_state.action_counts = {}
     if "processing_time" not in st.session_state:
         st.session_state.processing_time = 0
     if "show_logs" not in st.session_state:
@@ -45,68 +61,119 @@ def initialize_session_state():
     if "risk_threshold" not in st.session_state:
         st.session_state.risk_threshold = 0.7
 
-def export_results(results: List[Dict], format: str = "csv") -> None:
+EXPORT_FORMATS = ("parquet", "feather", "csv", "json")
+
+def _to_parquet(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    return buffer.getvalue()
+
+def _to_feather(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_feather(buffer, compression="lz4")
+    return buffer.getvalue()
+
+# Format -> (button label, MIME type, serializer)
+_EXPORT_WRITERS = {
+    "parquet": ("Download Parquet", "application/octet-stream", _to_parquet),
+    "feather": ("Download Feather", "application/octet-stream", _to_feather),
+    "csv": ("Download CSV", "text/csv", lambda df: df.to_csv(index=False)),
+    "json": (
+        "Download JSON",
+        "application/json",
+        lambda df: orjson.dumps(df.to_dict(orient="records"), option=orjson.OPT_INDENT_2)
+    ),
+}
+
+def build_exports(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
     """
-    Export audit results to file.
+    Serialize audit results into every export format.
+    
+    Called once per audit so Streamlit reruns do not re-serialize the results.
+    A format that fails to serialize (e.g. Arrow rejecting a column of mixed
+    types) is recorded with its error instead of failing the whole audit.
     
     Args:
-        results: List of audit results
-        format: Export format ('csv' or 'json')
+        df: DataFrame of audit results
+        
+    Returns:
+        Mapping of export format to download button arguments, or to
+        {"error": message} for formats that could not be built
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    exports = {}
+    for format in EXPORT_FORMATS:
+        label, mime, serialize = _EXPORT_WRITERS[format]
+        try:
+            data = serialize(df)
+        except Exception as e:
+            exports[format] = {"error": str(e)}
+            continue
+        exports[format] = {
+            "label": label,
+            "data": data,
+            "file_name": f"audit_results_{timestamp}.{format}",
+            "mime": mime
+        }
+    
+    return exports
+
+def export_results(exports: Dict[str, Dict[str, Any]], format: str = "parquet") -> None:
     """
-    if not results:
+    Offer prebuilt audit results for download.
+    
+    Args:
+        exports: Export files as returned by build_exports
+        format: Export format ('parquet', 'feather', 'csv' or 'json')
+    """
+    if format not in exports:
         error_message("No results to export")
         return
     
-    df = pd.DataFrame(results)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if "error" in exports[format]:
+        error_message(f"{format.capitalize()} export unavailable", exports[format]["error"])
+        return
     
-    if format == "csv":
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="Download CSV",
-            data=csv,
-            file_name=f"audit_results_{timestamp}.csv",
-            mime="text/csv"
-        )
-    else:
-        json_str = df.to_json(orient="records", indent=2)
-        st.download_button(
-            label="Download JSON",
-            data=json_str,
-            file_name=f"audit_results_{timestamp}.json",
-            mime="application/json"
-        )
+    st.download_button(**exports[format])
 
-def display_results(results: List[Dict]) -> None:
+def display_results(df: pd.DataFrame) -> None:
     """
     Display audit results in an interactive table.
     
     Args:
-        results: List of audit results
+        df: DataFrame of audit results
     """
-    if not results:
+    if df.empty:
         st.info("No results to display")
         return
     
-    df = pd.DataFrame(results)
+    # Let the frontend render images and labels instead of shipping per-row HTML
+    columns = ["username", "action", "reason", "engagement_score", "risk_score"]
+    if "profile_pic_url" in df and df["profile_pic_url"].notna().any():
+        columns.insert(0, "profile_pic_url")
     
-    # Add status badges
-    df["Status"] = df["action"].apply(
-        lambda x: status_badge(x)
-    )
-    
-    # Add profile previews
-    df["Profile"] = df.apply(
-        lambda row: profile_preview(
-            row["username"],
-            row.get("profile_pic_url")
-        ),
-        axis=1
-    )
+    # Only send one page of rows to the frontend
+    page_size = APP_CONFIG.MAX_DISPLAY_ITEMS
+    page_count = (len(df) + page_size - 1) // page_size
+    page = 1
+    if page_count > 1:
+        page = st.number_input(
+            f"Page (of {page_count})",
+            min_value=1,
+            max_value=page_count,
+            value=1
+        )
+    start = (page - 1) * page_size
     
     # Display interactive table
     st.dataframe(
-        df[["Profile", "Status", "reason", "engagement_score", "risk_score"]],
+        df[columns].iloc[start:start + page_size],
+        column_config={
+            "profile_pic_url": st.column_config.ImageColumn("Profile", width="small"),
+            "username": st.column_config.TextColumn("Username"),
+            "action": st.column_config.TextColumn("Status")
+        },
         use_container_width=True,
         hide_index=True
     )
@@ -126,34 +193,125 @@ def process_json_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             continue
             
         # Validate required fields
-        if "username" not in follower:
-            raise ValueError(f"Missing username in follower data: {follower}")
+        missing_fields = REQUIRED_FOLLOWER_FIELDS.difference(follower)
+        if missing_fields:
+            raise ValueError(
+                f"Missing {', '.join(sorted(missing_fields))} in follower data: {follower}"
+            )
             
         processed_data.append(follower)
     
     return processed_data
 
-async def process_followers(workflow: WorkflowController, followers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Process followers asynchronously.
+@st.cache_data(show_spinner=False, max_entries=16, ttl=APP_CONFIG.CACHE_TTL)
+def parse_upload(name: str, content: bytes) -> List[Dict[str, Any]]:
+    """Parse an uploaded follower file.
+    
+    Cached on the file name and contents, so widget changes that rerun the
+    script do not parse the same upload again. The cache is shared by all
+    sessions, so it is bounded in size and entries expire after CACHE_TTL.
+    
+    Args:
+        name: Uploaded file name, used to pick the parser
+        content: Raw file contents
+        
+    Returns:
+        Processed list of follower data
+    """
+    if name.endswith(".json"):
+        return process_json_data(safe_json_loads(content))
+    return pd.read_csv(io.BytesIO(content), engine="pyarrow").to_dict("records")
+
+def follower_cache_key(follower: Dict[str, Any], config_fingerprint: str) -> str:
+    """Build a stable cache key from a follower's data and the audit configuration.
+    
+    Args:
+        follower: Follower data dictionary
+        config_fingerprint: Fingerprint of the workflow configuration
+        
+    Returns:
+        Cache key for the follower's audit result
+    """
+    payload = orjson.dumps(follower, option=orjson.OPT_SORT_KEYS, default=str)
+    digest = hashlib.sha1(config_fingerprint.encode() + b"\0" + payload).hexdigest()
+    return CACHE_KEYS["analysis_results"].format(digest)
+
+async def process_followers(
+    workflow: WorkflowController,
+    followers: List[Dict[str, Any]],
+    cache: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Process followers concurrently.
     
     Args:
         workflow: WorkflowController instance
         followers: List of follower data
+        cache: Optional mapping of cache keys to (timestamp, result) pairs;
+            followers with a fresh entry are not audited again and expired
+            entries are removed
         
     Returns:
         List of audit results
     """
-    results = []
-    for follower in followers:
-        try:
-            result = await workflow.audit_follower(follower)
-            results.append(result)
-        except Exception as e:
-            error_message(
-                f"Error processing {follower.get('username', 'Unknown')}",
-                str(e)
-            )
-    return results
+    now = time.time()
+    
+    if cache is not None:
+        expired = [
+            key for key, (cached_at, _) in cache.items()
+            if now - cached_at >= APP_CONFIG.CACHE_TTL
+        ]
+        for key in expired:
+            del cache[key]
+    
+    keys = [
+        follower_cache_key(follower, workflow.config_fingerprint)
+        for follower in followers
+    ]
+    
+    # Only audit followers without a fresh cached result
+    slots: List[Any] = [None] * len(followers)
+    pending = []
+    for index, key in enumerate(keys):
+        entry = cache.get(key) if cache is not None else None
+        if entry is not None:
+            slots[index] = entry[1]
+        else:
+            pending.append(index)
+    
+    outcomes = await workflow.audit_followers(
+        [followers[index] for index in pending],
+        return_exceptions=True
+    )
+    
+    errors = []
+    for index, outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append(f"{followers[index].get('username', 'Unknown')}: {outcome}")
+            continue
+        slots[index] = outcome
+        if cache is not None:
+            cache[keys[index]] = (now, outcome)
+    
+    # Report failures once, after all audits have finished
+    if errors:
+        error_message(
+            f"Error processing {len(errors)} follower(s)",
+            "\n".join(errors)
+        )
+    return [result for result in slots if result is not None]
+
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 def main():
     """Main dashboard function."""
@@ -218,11 +376,7 @@ def main():
         if uploaded_file:
             try:
                 # Process file
-                if uploaded_file.name.endswith(".json"):
-                    data = json.load(uploaded_file)
-                    followers = process_json_data(data)
-                else:
-                    followers = pd.read_csv(uploaded_file).to_dict("records")
+                followers = parse_upload(uploaded_file.name, uploaded_file.getvalue())
                 
                 # Initialize workflow
                 workflow = WorkflowController(
@@ -235,42 +389,52 @@ def main():
                         start_time = time.time()
                         
                         # Process followers asynchronously
-                        results = asyncio.run(process_followers(workflow, followers))
+                        results = run_async(process_followers(
+                            workflow,
+                            followers,
+                            st.session_state.audit_cache
+                        ))
+                        
+                        # Build everything first so a failure leaves the previous
+                        # audit's results, exports and counts together
+                        results_df = pd.DataFrame(results)
+                        exports = build_exports(results_df) if results else {}
+                        action_counts = Counter(r["action"] for r in results)
                         
                         # Store results
-                        st.session_state.audit_results = results
+                        st.session_state.audit_results_df = results_df
+                        st.session_state.audit_exports = exports
+                        st.session_state.action_counts = action_counts
                         st.session_state.processing_time = time.time() - start_time
                         
                         success_message("Audit completed successfully!")
                 
                 # Display results
-                if st.session_state.audit_results:
+                results_df = st.session_state.audit_results_df
+                if results_df is not None and not results_df.empty:
                     st.subheader("Audit Results")
                     
                     # Statistics
                     stats_summary(
-                        total=len(st.session_state.audit_results),
-                        keep=sum(1 for r in st.session_state.audit_results if r["action"] == "keep"),
-                        remove=sum(1 for r in st.session_state.audit_results if r["action"] == "remove"),
+                        total=len(results_df),
+                        keep=st.session_state.action_counts.get("keep", 0),
+                        remove=st.session_state.action_counts.get("remove", 0),
                         processing_time=st.session_state.processing_time
                     )
                     
                     # Results table
-                    display_results(st.session_state.audit_results)
+                    display_results(results_df)
                     
                     # Export options
                     st.subheader("Export Results")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        export_results(st.session_state.audit_results, "csv")
-                    with col2:
-                        export_results(st.session_state.audit_results, "json")
+                    for export_col, export_format in zip(st.columns(len(EXPORT_FORMATS)), EXPORT_FORMATS):
+                        with export_col:
+                            export_results(st.session_state.audit_exports, export_format)
             
             except Exception as e:
-                error_message(
-                    "Error processing file",
-                    f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-                )
+                error_message("Error processing file", str(e))
+                with st.expander("Show traceback"):
+                    st.code(traceback.format_exc())
     
     with col2:
         # Information panel
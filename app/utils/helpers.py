@@ -7,10 +7,16 @@ import functools
 import time
 import random
 import asyncio
-from typing import Any, Callable, TypeVar, cast, Optional, Union, Tuple, Dict
+from typing import Any, Callable, TypeVar, cast, Optional, Union, Tuple, Dict, Iterable
 import logging
 from datetime import datetime
+import codecs
 import json
+from pathlib import Path
+import orjson
+
+# Default logger for async_retry (underscored to avoid clashing with its logger parameter)
+_logger = logging.getLogger(__name__)
 
 # Type variable for decorator typing
 F = TypeVar('F', bound=Callable[..., Any])
@@ -93,7 +99,7 @@ def async_retry(
             # Function implementation
     """
     if logger is None:
-        logger = logging.getLogger(__name__)
+        logger = _logger
         
     def decorator(func: F) -> F:
         @functools.wraps(func)
@@ -227,33 +233,80 @@ def normalize_score(score: float, min_val: float = 0.0, max_val: float = 1.0) ->
     """
     return max(min_val, min(max_val, score))
 
-def safe_json_loads(json_str: str) -> Dict[str, Any]:
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson, falling back to the stdlib parser.
+    
+    A leading UTF-8 byte order mark is stripped first. The stdlib fallback
+    accepts inputs orjson rejects, such as NaN and Infinity literals.
+    
+    Args:
+        data: JSON string or UTF-8 encoded bytes
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        ValueError: If neither parser accepts the data
+    """
+    if isinstance(data, bytes):
+        if data.startswith(codecs.BOM_UTF8):
+            data = data[len(codecs.BOM_UTF8):]
+    elif data.startswith("\ufeff"):
+        data = data[1:]
+    
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+def safe_json_loads(json_str: Union[str, bytes]) -> Any:
     """Safely parse JSON string with error handling.
     
     Args:
-        json_str: JSON string to parse
+        json_str: JSON string or UTF-8 encoded bytes to parse
         
     Returns:
-        Parsed JSON data as dictionary
+        Parsed JSON data
         
     Raises:
         ValueError: If JSON parsing fails
     """
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return _json_loads(json_str)
+    except ValueError as e:
         raise ValueError(f"Invalid JSON data: {str(e)}")
 
-def validate_required_fields(data: Dict[str, Any], required_fields: list[str]) -> None:
+def load_mock_data(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a mock data JSON file, parsing each file only once per process.
+    
+    The returned dictionary is shared between callers and must not be mutated.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data, or an empty dictionary if the file does not exist
+    """
+    return _load_mock_data_cached(str(Path(path).resolve()))
+
+@functools.lru_cache(maxsize=8)
+def _load_mock_data_cached(path: str) -> Dict[str, Any]:
+    """Read and parse a JSON file; cached by resolved path."""
+    file_path = Path(path)
+    if not file_path.exists():
+        return {}
+    return _json_loads(file_path.read_bytes())
+
+def validate_required_fields(data: Dict[str, Any], required_fields: Iterable[str]) -> None:
     """Validate that required fields are present in data.
     
     Args:
         data: Dictionary to validate
-        required_fields: List of required field names
+        required_fields: Required field names; pass a frozenset to avoid a copy
         
     Raises:
         ValueError: If any required field is missing
     """
-    missing_fields = [field for field in required_fields if field not in data]
+    missing_fields = frozenset(required_fields).difference(data)
     if missing_fields:
-        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}") 
\ No newline at end of file
+        raise ValueError(f"Missing required fields: {', '.join(sorted(missing_fields))}") 
\ No newline at end of file
@@ -7,7 +7,9 @@ Note: This is a placeholder module. Implement actual API calls when available.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
-from ..utils.helpers import retry
+from ..utils.helpers import async_retry
+
+logger = logging.getLogger(__name__)
 
 class InstagramAPI:
     """Placeholder class for Instagram API interactions."""
@@ -20,10 +22,14 @@ class InstagramAPI:
             api_key: Optional API key for authentication
         """
         self.api_key = api_key
-        self.logger = logging.getLogger(__name__)
     
-    @retry(max_attempts=3, delay=1.0)
-    def get_follower_info(self, follower_id: str) -> Dict[str, Any]:
+    @async_retry(
+        max_attempts=3,
+        base_delay=1.0,
+        max_delay=10.0,
+        exceptions=(ConnectionError, TimeoutError)
+    )
+    async def get_follower_info(self, follower_id: str) -> Dict[str, Any]:
         """
         Get information about a follower.
         
@@ -34,7 +40,7 @@ class InstagramAPI:
             Dictionary containing follower information
         """
         # TODO: Implement actual API call
-        self.logger.info(f"Getting info for follower {follower_id}")
+        logger.info(f"Getting info for follower {follower_id}")
         return {
             "id": follower_id,
             "username": "example_user",
@@ -45,8 +51,13 @@ class InstagramAPI:
             "is_verified": False
         }
     
-    @retry(max_attempts=3, delay=1.0)
-    def get_engagement_metrics(
+    @async_retry(
+        max_attempts=3,
+        base_delay=1.0,
+        max_delay=10.0,
+        exceptions=(ConnectionError, TimeoutError)
+    )
+    async def get_engagement_metrics(
         self,
         follower_id: str,
         start_date: Optional[datetime] = None,
@@ -64,7 +75,7 @@ class InstagramAPI:
             Dictionary containing engagement metrics
         """
         # TODO: Implement actual API call
-        self.logger.info(f"Getting engagement metrics for {follower_id}")
+        logger.info(f"Getting engagement metrics for {follower_id}")
         return {
             "likes": 100,
             "comments": 20,
@@ -74,8 +85,13 @@ class InstagramAPI:
             "dm_interactions": 2
         }
     
-    @retry(max_attempts=3, delay=1.0)
-    def get_followers_list(
+    @async_retry(
+        max_attempts=3,
+        base_delay=1.0,
+        max_delay=10.0,
+        exceptions=(ConnectionError, TimeoutError)
+    )
+    async def get_followers_list(
         self,
         account_id: str,
         limit: Optional[int] = None
@@ -91,7 +107,7 @@ class InstagramAPI:
             List of follower information dictionaries
         """
         # TODO: Implement actual API call
-        self.logger.info(f"Getting followers list for account {account_id}")
+        logger.info(f"Getting followers list for account {account_id}")
         return [
             {
                 "id": f"follower_{i}",
@@ -2,17 +2,28 @@
 Script to run the Instagram Follower Audit Tool.
 """
 
-import os
+import subprocess
 import sys
+from importlib.metadata import distributions
 from pathlib import Path
 
 # Get the project root directory
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent
 
-# Install the package in development mode if not already installed
-if not any(p.startswith("instagram-follower-audit") for p in sys.modules):
-    os.system(f"pip install -e {project_root}")
+# Install the package in development mode if not already installed. The project
+# root is excluded from the lookup: it is sys.path[0] when running this script,
+# and the egg-info left there by an earlier editable install would otherwise
+# count as installed in a fresh environment.
+search_path = [p for p in sys.path if Path(p or ".").resolve() != project_root]
+if not any(distributions(name="instagram-follower-audit", path=search_path)):
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", "-e", str(project_root)],
+        check=True
+    )
 
 # Run the Streamlit app
 if __name__ == "__main__":
-    os.system(f"streamlit run {project_root}/app/main.py") 
\ No newline at end of file
+    subprocess.run(
+        [sys.executable, "-m", "streamlit", "run", str(project_root / "app" / "main.py")],
+        check=True
+    )
\ No newline at end of file
@@ -8,6 +8,7 @@ setup(
         "streamlit>=1.32.0",
         "plotly>=5.18.0",
         "pandas>=2.2.0",
+        "pyarrow>=15.0.0",
         "numpy>=1.26.0",
         "python-dotenv>=1.0.0",
         "requests>=2.31.0",
@@ -16,8 +17,10 @@ setup(
         "pytz>=2024.1",
         "openai>=1.12.0",
         "aiohttp>=3.9.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
         "streamlit-option-menu>=0.3.12",
         "pillow>=10.2.0",
+        "orjson>=3.9.0",
         "streamlit-extras>=0.3.5"
     ],
 ) 
\ No newline at end of file